@@ -6,13 +6,15 @@ This module defines all API endpoints for the Image Frames API.
 Endpoints:
 - GET /health: Health check with database connectivity test
 - GET /frames: Retrieve frames by depth range with pagination
+- GET /frames/{depth}/image.png: Render a single frame as PNG at a chosen width
 - POST /frames/reload: Admin endpoint to trigger re-ingestion (secured)
 """
 
+import hashlib
 import time
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.models import (
@@ -26,6 +28,7 @@ from app.api.models import (
 from app.core import clear_all_caches, get_cache_stats, get_logger, settings
 from app.db import Frame, get_db
 from app.db.operations import count_frames, get_depth_range, get_frames_by_depth_range
+from app.processing import render_raw_row
 
 logger = get_logger(__name__)
 
@@ -258,6 +261,114 @@ async def get_frames(
         )
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value (possibly a list or weak tags) against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+@router.get(
+    "/frames/{depth}/image.png",
+    summary="Render a frame as PNG",
+    description="""
+    Render a single frame as a colorized PNG at the requested width.
+
+    **Rendering:**
+    - Frames store their raw grayscale row; the PNG is rendered on request
+    - `width`: Output width in pixels (default: 150, max: 4096)
+    - Identical requests are served from an in-memory LRU of rendered PNGs
+
+    **Caching:**
+    - Responses carry a strong `ETag` derived from the raw row and width,
+      plus `Cache-Control: no-cache` (re-ingestion can change a depth's image,
+      so clients must revalidate)
+    - Send `If-None-Match` to receive `304 Not Modified` without a body
+
+    **Example queries:**
+    - Stored width: `GET /frames/100.5/image.png`
+    - Wider render: `GET /frames/100.5/image.png?width=600`
+    """,
+    response_class=Response,
+    responses={
+        200: {"content": {"image/png": {}}, "description": "PNG image"},
+        304: {"description": "Not modified (ETag matched)"},
+        404: {"description": "No frame at this depth", "model": ErrorResponse},
+        409: {
+            "description": "Frame has no raw row stored; only its stored width is available",
+            "model": ErrorResponse,
+        },
+    },
+    tags=["frames"],
+)
+async def get_frame_image(
+    depth: float,
+    width: int = Query(
+        default=150,
+        description="Output image width in pixels",
+        examples=[150, 600],
+        ge=1,
+        le=4096,
+    ),
+    if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    Render one frame to PNG at read time.
+
+    Frames ingested before raw rows were stored can still be fetched at
+    their stored width (the stored PNG is returned as-is).
+
+    Args:
+        depth: Depth value of the frame
+        width: Output image width in pixels (1-4096)
+        if_none_match: ETag(s) from the client's cached copy
+        db: Database session (injected)
+
+    Returns:
+        Response with PNG body, or an empty 304 response if the ETag matched
+
+    Raises:
+        HTTPException: 404 if no frame exists at depth
+        HTTPException: 409 if the frame has no raw row and width differs
+    """
+    # Plain primary-key lookup; repeat requests are absorbed by the ETag and
+    # the rendered-PNG memo rather than the frame TTL cache
+    frame = await db.get(Frame, depth)
+    if frame is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No frame found at depth {depth}",
+        )
+
+    if frame.raw_gray:
+        etag = f'"{hashlib.blake2b(frame.raw_gray, digest_size=16).hexdigest()}-w{width}"'
+    elif width == frame.width:
+        etag = f'"{hashlib.blake2b(frame.image_png, digest_size=16).hexdigest()}"'
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                f"Frame at depth {depth} has no raw row stored; "
+                f"re-ingest to render widths other than {frame.width}"
+            ),
+        )
+
+    # Content at a depth changes on reload, so clients revalidate via the ETag
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if frame.raw_gray:
+        png_bytes, _, _ = render_raw_row(frame.raw_gray, target_width=width)
+    else:
+        png_bytes = frame.image_png
+
+    return Response(content=png_bytes, media_type="image/png", headers=headers)
+
+
 @router.post(
     "/frames/reload",
     response_model=ReloadResponse,
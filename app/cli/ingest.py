@@ -15,12 +15,13 @@ Where:
 
 Processing Pipeline:
     1. Read CSV in chunks (default: 500 rows) using pandas
-    2. For each row:
-       - Extract depth and 200 pixel values
-       - Resize from 200px → 150px (bilinear interpolation)
+    2. For each chunk:
+       - Extract depths and the 200 pixel columns
+       - Resize from 200px → 150px (linear interpolation, whole chunk at once)
        - Apply colormap LUT (grayscale → RGB)
-       - Encode as PNG
-    3. Upsert to database (idempotent - overwrites on duplicate depth)
+       - Encode each row as PNG (thread pool, ENCODE_WORKERS threads)
+    3. Upsert each chunk in one batched statement + commit (idempotent -
+       overwrites on duplicate depth)
     4. Log progress and metrics
 
 Usage:
@@ -43,8 +44,9 @@ from pathlib import Path
 import pandas as pd
 
 from app.core import get_logger, settings, setup_logging
-from app.db import get_db_context, upsert_frame
-from app.processing import process_row_to_png
+from app.db import get_db_context, upsert_frames_batch
+from app.processing import get_png_cache_stats
+from app.processing.ingest import process_chunk_to_frames
 
 # Initialize logging
 setup_logging(settings.log_level)
@@ -87,8 +89,6 @@ async def ingest_csv(
         },
     )
 
-    # No need to pre-compute colormap - process_row_to_png handles everything!
-
     # ========================================
     # CSV Processing
     # ========================================
@@ -103,6 +103,7 @@ async def ingest_csv(
         csv_reader = pd.read_csv(
             csv_path,
             chunksize=chunk_size,
+            engine="c",
             na_filter=False,  # Don't convert empty strings to NaN - prevents IntCastingNaNError
             dtype={
                 "depth": float,  # First column is depth
@@ -117,55 +118,28 @@ async def ingest_csv(
             chunk_num += 1
             chunk_start = time.time()
 
-            # Get database session for this chunk
+            # ========================================
+            # Image Processing Pipeline
+            # ========================================
+            # Resize (200→150) + colormap + PNG encoding for the whole chunk;
+            # rows that fail are skipped (per-row fallback) and counted here
+            frames_data = await process_chunk_to_frames(
+                chunk_df, max_workers=settings.encode_workers
+            )
+            failed_rows += len(chunk_df) - len(frames_data)
+
+            # ========================================
+            # Database Upsert
+            # ========================================
+            # Upsert = INSERT or UPDATE (idempotent ingestion)
+            # If depth already exists, we overwrite with new data.
+            # One batched statement and one commit per chunk.
             async with get_db_context() as session:
-                # Process each row in the chunk
-                for idx, row in chunk_df.iterrows():
-                    try:
-                        # Extract depth value (primary key)
-                        depth = float(row["depth"])
-
-                        # Extract pixel values (200 columns)
-                        # Note: CSV columns are named col1-col200, not 0-199
-                        pixel_values = row[[f"col{i}" for i in range(1, 201)]].values
-
-                        # ========================================
-                        # Image Processing Pipeline
-                        # ========================================
-                        # One-stop shop: resize (200→150) + colormap + PNG encoding
-                        # This helper function does all the heavy lifting! 🚀
-                        png_bytes, width, height = process_row_to_png(
-                            row_data=pixel_values, source_width=200, target_width=150
-                        )
-
-                        # ========================================
-                        # Database Upsert
-                        # ========================================
-                        # Upsert = INSERT or UPDATE (idempotent ingestion)
-                        # If depth already exists, we overwrite with new data
-                        await upsert_frame(
-                            session=session,
-                            depth=depth,
-                            width=width,
-                            height=height,
-                            png_bytes=png_bytes,
-                        )
-
-                        successful_rows += 1
-
-                    except Exception as e:
-                        failed_rows += 1
-                        logger.error(
-                            f"Failed to process row {idx}",
-                            extra={
-                                "error": str(e),
-                                "depth": row.get("depth", "unknown"),
-                            },
-                        )
-
-                # Commit the chunk
+                await upsert_frames_batch(session, frames_data)
                 await session.commit()
 
+            successful_rows += len(frames_data)
+
             # ========================================
             # Progress Logging
             # ========================================
@@ -213,6 +187,7 @@ async def ingest_csv(
         "CSV ingestion complete",
         extra=stats,
     )
+    logger.info("PNG memo cache", extra=get_png_cache_stats())
 
     return stats
 
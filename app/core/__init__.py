@@ -1,6 +1,7 @@
 """Core application utilities and configuration exports."""
 
 from app.core.cache import (
+    LRUCache,
     cache_frame,
     cache_range,
     cleanup_expired_entries,
@@ -18,6 +19,7 @@ __all__ = [
     "get_logger",
     "set_request_id",
     "get_request_id",
+    "LRUCache",
     "cache_frame",
     "cache_range",
     "get_cache_stats",
@@ -4,6 +4,7 @@ Caching utilities for performance optimization.
 This module provides caching decorators and utilities to speed up frequent queries:
 - LRU cache for single frame lookups
 - TTL-based cache for depth range queries
+- Plain LRU cache for hot-path memoization (e.g. duplicate-row PNGs)
 - Cache statistics and management
 
 Performance benefits:
@@ -14,6 +15,7 @@ Performance benefits:
 
 import hashlib
 import json
+import threading
 import time
 from collections import OrderedDict
 from functools import wraps
@@ -184,6 +186,104 @@ class TTLCache:
         return len(expired_keys)
 
 
+class LRUCache:
+    """
+    Size-bounded LRU cache without expiration, for hot-path memoization.
+
+    Unlike TTLCache, keys are used as-is (any hashable, e.g. bytes) and
+    entries never expire, so lookups cost a single dict access. Guarded by
+    a lock so it can be shared between worker threads.
+
+    Args:
+        max_size: Maximum number of entries (default: 4096, 0 disables caching)
+
+    Example:
+        >>> cache = LRUCache(max_size=2)
+        >>> cache.set(b"row", b"png")
+        >>> cache.get(b"row")  # Returns b"png"
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Any) -> Optional[Any]:
+        """
+        Retrieve value from cache.
+
+        Args:
+            key: Hashable cache key
+
+        Returns:
+            Cached value or None if not found
+        """
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+
+            # Cache hit - move to end (most recently used)
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """
+        Store value in cache, evicting the least recently used entry if full.
+
+        Args:
+            key: Hashable cache key
+            value: Value to store
+        """
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+    def record_hits(self, count: int) -> None:
+        """Count hits served outside get() (e.g. duplicates within one batch)."""
+        with self._lock:
+            self._hits += count
+
+    def clear(self) -> None:
+        """Clear all entries from cache."""
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, hit_rate, size, etc.
+        """
+        total_requests = self._hits + self._misses
+        hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0.0
+
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "total_requests": total_requests,
+            "hit_rate_percent": round(hit_rate, 2),
+        }
+
+
 # Global cache instances
 _frame_cache = TTLCache(max_size=1000, ttl_seconds=60)
 _range_cache = TTLCache(max_size=100, ttl_seconds=60)
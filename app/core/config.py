@@ -5,6 +5,7 @@ This module provides a centralized configuration management system using environ
 Settings can be overridden via .env file or system environment variables.
 """
 
+import os
 from functools import lru_cache
 from typing import Literal
 
@@ -27,6 +28,10 @@ class Settings(BaseSettings):
         api_reload: Enable auto-reload on code changes (dev only)
         csv_file_path: Path to the input CSV file for ingestion
         chunk_size: Number of rows to process in each batch during ingestion
+        encode_workers: Number of threads used for PNG encoding during ingestion
+            (default: CPU count, capped at 64)
+        png_cache_size: Max distinct PNGs memoized in-process, shared by ingestion
+            and the API image endpoint
     """
 
     model_config = SettingsConfigDict(
@@ -64,6 +69,18 @@ class Settings(BaseSettings):
     chunk_size: int = Field(
         default=500, ge=1, le=10000, description="Batch size for CSV processing"
     )
+    encode_workers: int = Field(
+        default_factory=lambda: min(os.cpu_count() or 1, 64),
+        ge=1,
+        le=64,
+        description="Threads for PNG encoding during ingestion (1 = serial)",
+    )
+    png_cache_size: int = Field(
+        default=4096,
+        ge=0,
+        le=1_000_000,
+        description="PNG memo size for ingestion and API-rendered images (0 = disabled)",
+    )
 
     # Security settings
     admin_token: str = Field(
@@ -26,9 +26,14 @@ class Frame(Base):
     2. Colorized using a custom color map
     3. Encoded as PNG binary data
 
+    The clamped uint8 source row is kept alongside the PNG so frames can be
+    re-rendered at other widths at read time without re-ingesting.
+
     Attributes:
         depth: Depth value (primary key, unique identifier for each frame)
         image_png: PNG-encoded image binary data
+        raw_gray: Raw uint8 grayscale source row (one byte per pixel), or None
+            for frames ingested before raw rows were stored
         width: Image width in pixels (should be 150 after processing)
         height: Image height in pixels (should be 1 for single-row images)
         created_at: Timestamp when the frame was first created
@@ -52,6 +57,13 @@ class Frame(Base):
         doc="PNG-encoded image binary data",
     )
 
+    # Raw source row for read-time rendering (nullable for older rows)
+    raw_gray: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        doc="Raw uint8 grayscale source row (200 bytes)",
+    )
+
     # Image dimensions
     width: Mapped[int] = mapped_column(
         Integer,
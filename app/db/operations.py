@@ -5,11 +5,13 @@ This module provides high-level database operations with proper transaction
 management, error handling, and performance optimizations.
 """
 
+import logging
 from typing import Optional, Sequence
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.core import cache_frame, cache_range, get_logger
 from app.db.models import Frame
@@ -23,6 +25,7 @@ async def upsert_frame(
     width: int,
     height: int,
     png_bytes: bytes,
+    raw_gray: Optional[bytes] = None,
 ) -> Frame:
     """
     Insert or update a single frame (idempotent operation).
@@ -41,6 +44,7 @@ async def upsert_frame(
         width: Image width in pixels
         height: Image height in pixels
         png_bytes: PNG-encoded image binary data
+        raw_gray: Raw uint8 grayscale source row for read-time rendering
 
     Returns:
         Frame: The created or updated Frame object
@@ -56,6 +60,7 @@ async def upsert_frame(
         width=width,
         height=height,
         image_png=png_bytes,
+        raw_gray=raw_gray,
     )
 
     # On conflict, update all fields except created_at
@@ -63,6 +68,7 @@ async def upsert_frame(
         index_elements=["depth"],
         set_={
             "image_png": stmt.excluded.image_png,
+            "raw_gray": stmt.excluded.raw_gray,
             "width": stmt.excluded.width,
             "height": stmt.excluded.height,
             "updated_at": func.now(),  # Manually set updated_at timestamp
@@ -81,15 +87,17 @@ async def upsert_frame(
     # Refresh from database to get latest values
     await session.refresh(frame)
 
-    logger.debug(
-        "Upserted frame",
-        extra={
-            "depth": depth,
-            "width": width,
-            "height": height,
-            "size_bytes": len(png_bytes),
-        },
-    )
+    # Called once per row during CLI ingestion: skip building extra when off
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Upserted frame",
+            extra={
+                "depth": depth,
+                "width": width,
+                "height": height,
+                "size_bytes": len(png_bytes),
+            },
+        )
 
     return frame
 
@@ -111,6 +119,7 @@ async def upsert_frames_batch(
     Args:
         session: Async database session
         frames: List of frame dicts with keys: depth, width, height, image_png
+            (and optionally raw_gray)
 
     Returns:
         int: Number of frames upserted
@@ -133,6 +142,7 @@ async def upsert_frames_batch(
         index_elements=["depth"],
         set_={
             "image_png": stmt.excluded.image_png,
+            "raw_gray": stmt.excluded.raw_gray,
             "width": stmt.excluded.width,
             "height": stmt.excluded.height,
             "updated_at": func.now(),  # Manually set updated_at timestamp
@@ -183,7 +193,9 @@ async def get_frames_by_depth_range(
     Retrieve frames within a depth range with pagination.
 
     Efficient query using indexed depth column (primary key).
-    Sorted by depth ascending for consistent ordering.
+    Sorted by depth ascending for consistent ordering. The raw_gray blob
+    is not loaded (only image_png is served from listings), so returned
+    frames must not access it.
 
     Args:
         session: Async database session
@@ -208,7 +220,7 @@ async def get_frames_by_depth_range(
     if depth_max is not None:
         conditions.append(Frame.depth <= depth_max)
 
-    query = select(Frame)
+    query = select(Frame).options(defer(Frame.raw_gray, raiseload=True))
     if conditions:
         query = query.where(and_(*conditions))
 
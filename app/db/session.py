@@ -9,6 +9,7 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Optional
 
+from sqlalchemy import Connection, inspect, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -142,16 +143,43 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def _add_missing_columns(conn: Connection) -> None:
+    """
+    Add nullable model columns missing from tables created by an older schema.
+
+    create_all() never alters existing tables, so columns added to a model
+    later (e.g. Frame.raw_gray) are added here with ALTER TABLE.
+    """
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+
+            column_type = column.type.compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+            logger.info(
+                "Added missing column",
+                extra={"table": table.name, "column": column.name, "type": column_type},
+            )
+
+
 async def init_db() -> None:
     """
     Initialize the database by creating all tables.
 
-    Creates tables defined in SQLAlchemy models if they don't exist.
+    Creates tables defined in SQLAlchemy models if they don't exist, and
+    adds nullable columns introduced since an existing table was created.
     Idempotent operation - safe to call multiple times.
     """
     engine = get_engine()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
     logger.info("Database tables initialized")
 
 
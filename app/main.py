@@ -26,6 +26,7 @@ from app.api import router
 from app.core import get_logger, settings, setup_logging
 from app.db import close_db, init_db
 from app.middleware import RequestIDMiddleware
+from app.processing import get_backend_info
 
 # Initialize structured logging
 # (Yes, we log in JSON. No, we're not sorry. Machines > humans for parsing logs)
@@ -76,6 +77,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     await init_db()
     logger.info("Database initialized")
 
+    # Report image backends (Pillow vs Pillow-SIMD, Numba JIT) for operators
+    logger.info("Image processing backends", extra=get_backend_info())
+
     # Hand control back to FastAPI
     # (This is where the magic happens - FastAPI handles all the requests)
     yield
@@ -4,10 +4,16 @@ from app.processing.image import (
     COLORMAP_LUT,
     apply_colormap,
     apply_lut,
+    clip_to_uint8,
     encode_to_png,
     generate_colormap_lut,
+    get_backend_info,
+    get_png_cache_stats,
     make_colormap_lut,
     process_row_to_png,
+    process_row_to_png_fused,
+    process_rows_to_png,
+    render_raw_row,
     resize_gray_width,
     resize_grayscale_row,
 )
@@ -22,4 +28,10 @@ __all__ = [
     "resize_grayscale_row",
     "encode_to_png",
     "process_row_to_png",
+    "process_row_to_png_fused",
+    "process_rows_to_png",
+    "render_raw_row",
+    "clip_to_uint8",
+    "get_backend_info",
+    "get_png_cache_stats",
 ]
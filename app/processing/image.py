@@ -3,21 +3,42 @@ Image processing utilities for grayscale to colorized PNG conversion.
 
 This module provides vectorized operations for:
 1. Color map LUT generation (256×3 RGB lookup table)
-2. Image resizing (1×200 → 1×150 with bilinear interpolation)
+2. Image resizing (1×200 → 1×150 with linear interpolation)
 3. Grayscale to RGB color mapping (vectorized via NumPy indexing)
+4. Fused single-pass row → PNG conversion with reusable scratch buffers
+5. Batched rows → PNG conversion (vectorized resize/colormap, per-row encode)
+   with duplicate rows memoized in an LRU cache
+6. Direct PNG encoding (hand-assembled chunks + zlib, no Pillow)
+
+If Numba is installed (`poetry install -E jit`), resize + colormap for the
+fused and batched pipelines run in a single compiled kernel; otherwise the
+equivalent NumPy code path is used. Both produce identical pixels.
 """
 
-from io import BytesIO
-from typing import Final
+import struct
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Final, cast
 
 import numpy as np
+import PIL
 from numpy.typing import NDArray
 from PIL import Image
 
-from app.core import get_logger
+from app.core import LRUCache, get_logger, settings
+
+njit: Callable[..., Any] | None
+try:
+    from numba import njit, types
+except ImportError:  # Optional dependency (poetry extra "jit")
+    njit = None
 
 logger = get_logger(__name__)
 
+# Pillow-SIMD is a drop-in Pillow fork; its wheels carry a ".postN" version
+PILLOW_SIMD: Final[bool] = ".post" in PIL.__version__
+
 # Color stops for gradient (dark blue → teal/green → yellow → orange/red)
 # These create a visually appealing depth colormap for seismic/geological data
 # Format: (grayscale_value, (R, G, B))
@@ -59,25 +80,19 @@ def make_colormap_lut() -> NDArray[np.uint8]:
 
     Notes:
         - Fully deterministic (no random seed needed)
-        - Vectorized linear interpolation
+        - Vectorized linear interpolation (one np.interp per channel)
         - Pre-computed at module load for O(1) lookup
     """
-    # Initialize LUT array
-    lut = np.zeros((256, 3), dtype=np.uint8)
-
-    # Interpolate between each pair of color stops
-    for i in range(len(COLOR_STOPS) - 1):
-        start_idx, start_color = COLOR_STOPS[i]
-        end_idx, end_color = COLOR_STOPS[i + 1]
+    # Color stop positions (5,) and RGB values (5, 3)
+    xs = np.array([stop[0] for stop in COLOR_STOPS], dtype=np.float32)
+    ys = np.array([stop[1] for stop in COLOR_STOPS], dtype=np.float32)
+    x = np.arange(256, dtype=np.float32)
 
-        # Number of steps between stops
-        num_steps = end_idx - start_idx
-
-        # Linear interpolation for each RGB channel
-        for channel in range(3):
-            lut[start_idx : end_idx + 1, channel] = np.linspace(
-                start_color[channel], end_color[channel], num_steps + 1, dtype=np.uint8
-            )
+    # One piecewise-linear interpolation per channel over the full 0-255 range
+    # (each index is written exactly once, no overlap at the stop boundaries)
+    lut = np.empty((256, 3), dtype=np.uint8)
+    for channel in range(3):
+        lut[:, channel] = np.interp(x, xs, ys[:, channel]).astype(np.uint8)
 
     logger.debug("Generated colormap LUT", extra={"shape": lut.shape, "dtype": str(lut.dtype)})
     return lut
@@ -126,17 +141,23 @@ def apply_lut(gray_2d_uint8: NDArray[np.uint8], lut: NDArray[np.uint8]) -> NDArr
     return lut[gray_2d_uint8]
 
 
-def apply_colormap(grayscale: NDArray[np.uint8]) -> NDArray[np.uint8]:
+def apply_colormap(
+    grayscale: NDArray[np.uint8], out: NDArray[np.uint8] | None = None
+) -> NDArray[np.uint8]:
     """
     Apply pre-computed color map to grayscale image using vectorized LUT indexing.
 
     Convenience wrapper around apply_lut() that uses the global COLORMAP_LUT.
+    Pass `out` to gather into a preallocated buffer instead of allocating a
+    new array (useful in per-row hot loops).
 
     Args:
         grayscale: Grayscale image array with values 0-255, any shape
+        out: Optional uint8 buffer of shape (*grayscale.shape, 3) to write into
 
     Returns:
         NDArray[np.uint8]: RGB image with shape (*grayscale.shape, 3)
+        (`out` itself when provided)
 
     Example:
         >>> gray = np.array([[0, 128, 255]], dtype=np.uint8)
@@ -144,6 +165,10 @@ def apply_colormap(grayscale: NDArray[np.uint8]) -> NDArray[np.uint8]:
         >>> rgb.shape
         (1, 3, 3)  # 1 row, 3 pixels, 3 channels
     """
+    if out is not None:
+        # mode="raise" gathers into a temporary before copying to out; uint8
+        # indices can never leave the 256-row LUT, so clip skips that copy
+        return np.take(COLORMAP_LUT, grayscale, axis=0, out=out, mode="clip")
     return apply_lut(grayscale, COLORMAP_LUT)
 
 
@@ -158,9 +183,15 @@ def resize_gray_width(
     **Resizing Strategy:**
     - Goal: Reliable 200→150 resizing, minimal artifacts, fast
     - Uses Pillow's bilinear resampling by default (good quality/speed balance)
+    - Image.Resampling.BOX is the cheapest filter for pure downscaling;
+      higher-order filters (BICUBIC, LANCZOS) cost more and are not
+      distinguishable once the 256-entry colormap is applied
     - Maintains dtype integrity (uint8) and proper shape
     - Suitable for batch processing
 
+    The ingestion pipelines do not go through Pillow at all; they use the
+    NumPy linear resampler behind resize_grayscale_row().
+
     Args:
         gray_2d_uint8: 2D grayscale array of shape (height, width) with uint8 values
         new_width: Target width (default 150 for 200→150 conversion)
@@ -215,12 +246,107 @@ def resize_gray_width(
     return resized_array
 
 
+# Max distinct widths kept by the per-width caches below. Widths come from
+# API query parameters too, so these caches must stay bounded.
+WIDTH_CACHE_SIZE: Final[int] = 16
+
+# Cached linear resampling tables keyed by (source_width, target_width)
+# Each entry is (i0, w0, w1): left source index and weights for i0 and i0 + 1
+_WEIGHT_CACHE = LRUCache(max_size=WIDTH_CACHE_SIZE)
+
+
+def _get_weights(
+    source_width: int, target_width: int
+) -> tuple[NDArray[np.int32], NDArray[np.float32], NDArray[np.float32]]:
+    """
+    Get (or build and cache) the 1D linear resampling tables for a width pair.
+
+    Uses pixel-center alignment: output pixel j samples source coordinate
+    (j + 0.5) * source_width / target_width - 0.5.
+
+    Args:
+        source_width: Input row width in pixels
+        target_width: Output row width in pixels
+
+    Returns:
+        tuple: (i0, w0, w1) arrays of shape (target_width,)
+    """
+    weights = _WEIGHT_CACHE.get((source_width, target_width))
+    if weights is None:
+        x = (np.arange(target_width) + 0.5) * (source_width / target_width) - 0.5
+        # Clamp so that i0 + 1 is always a valid index (edges extend the border pixel)
+        i0 = np.clip(np.floor(x).astype(np.int32), 0, max(source_width - 2, 0))
+        w1 = np.clip(x - i0, 0.0, 1.0).astype(np.float32)
+        w0 = (1.0 - w1).astype(np.float32)
+        weights = (i0, w0, w1)
+        _WEIGHT_CACHE.set((source_width, target_width), weights)
+    return weights  # type: ignore[no-any-return]
+
+
+# Precompute the tables for the ingestion widths (200 → 150) at import time
+_get_weights(200, 150)
+
+
+def _rows_to_rgb_numpy(
+    rows_u8: NDArray[np.uint8],
+    i0: NDArray[np.int32],
+    w0: NDArray[np.float32],
+    w1: NDArray[np.float32],
+    lut: NDArray[np.uint8],
+    out_rgb: NDArray[np.uint8],
+) -> None:
+    """Resample (N, S) uint8 rows and colorize them into out_rgb (N, T, 3)."""
+    resized = (
+        rows_u8[:, i0].astype(np.float32) * w0 + rows_u8[:, 1:][:, i0].astype(np.float32) * w1 + 0.5
+    ).astype(np.uint8)
+    np.take(lut, resized, axis=0, out=out_rgb, mode="clip")  # No bounds-check temporary
+
+
+if njit is not None:
+    # Compiled eagerly at import (explicit signatures) and cached on disk.
+    # fastmath is left off so results match the NumPy path bit for bit.
+    # The second signature accepts read-only rows (e.g. np.frombuffer views).
+    _ROWS_ARG = types.Array(types.uint8, 2, "C")
+    _TABLE_ARGS = (
+        types.Array(types.int32, 1, "C"),
+        types.Array(types.float32, 1, "C"),
+        types.Array(types.float32, 1, "C"),
+        types.Array(types.uint8, 2, "C"),
+        types.Array(types.uint8, 3, "C"),
+    )
+
+    @njit(
+        [
+            types.void(_ROWS_ARG, *_TABLE_ARGS),
+            types.void(_ROWS_ARG.copy(readonly=True), *_TABLE_ARGS),
+        ],
+        cache=True,
+        nogil=True,
+    )
+    def _rows_to_rgb(rows_u8, i0, w0, w1, lut, out_rgb):  # type: ignore[no-untyped-def]
+        for n in range(rows_u8.shape[0]):
+            for j in range(i0.shape[0]):
+                k = i0[j]
+                g = np.uint8(
+                    np.float32(rows_u8[n, k]) * w0[j]
+                    + np.float32(rows_u8[n, k + 1]) * w1[j]
+                    + np.float32(0.5)
+                )
+                out_rgb[n, j, 0] = lut[g, 0]
+                out_rgb[n, j, 1] = lut[g, 1]
+                out_rgb[n, j, 2] = lut[g, 2]
+
+else:
+    _rows_to_rgb = _rows_to_rgb_numpy
+
+
 def resize_grayscale_row(row: NDArray[np.uint8], target_width: int = 150) -> NDArray[np.uint8]:
     """
     Resize a single grayscale row from 200 to target width.
 
-    Legacy convenience wrapper around resize_gray_width() for 1D arrays.
-    For new code, prefer resize_gray_width() which handles 2D arrays directly.
+    Uses a pure NumPy 1D linear resampler (gather + multiply-add) with cached
+    index/weight tables, avoiding per-row PIL Image construction. For 2D
+    arrays or other Pillow filters, use resize_gray_width().
 
     Args:
         row: 1D grayscale array of shape (200,) with uint8 values
@@ -235,46 +361,168 @@ def resize_grayscale_row(row: NDArray[np.uint8], target_width: int = 150) -> NDA
         >>> resized.shape
         (150,)
     """
-    # Reshape to 2D, resize, then flatten
-    gray_2d = row.reshape(1, -1)
-    resized_2d = resize_gray_width(gray_2d, new_width=target_width)
-    return resized_2d.flatten()
+    # Same width: linear weights would be exactly (1, 0), so just copy
+    if len(row) == target_width:
+        return row.copy()
+
+    # A single source pixel has no neighbour to interpolate with
+    if len(row) == 1:
+        return np.full(target_width, row[0], dtype=np.uint8)
+
+    i0, w0, w1 = _get_weights(len(row), target_width)
+
+    # Weighted sum of neighbours, rounded to nearest (values stay within 0-255).
+    # row[1:][i0] == row[i0 + 1] without allocating the shifted index array;
+    # the float32 products are accumulated in place.
+    resized = row[i0].astype(np.float32)
+    resized *= w0
+    resized += row[1:][i0].astype(np.float32) * w1
+    resized += 0.5
+    return resized.astype(np.uint8)
+
+
+# PNG file signature and zlib level for IDAT (speed over size for tiny images)
+PNG_SIGNATURE: Final[bytes] = b"\x89PNG\r\n\x1a\n"
+PNG_COMPRESS_LEVEL: Final[int] = zlib.Z_BEST_SPEED
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Build a PNG chunk: length + type + data + CRC32(type + data)."""
+    crc = zlib.crc32(data, zlib.crc32(chunk_type))
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+
+# IEND carries no data, so the whole chunk (including its CRC) is constant
+IEND_CHUNK: Final[bytes] = _png_chunk(b"IEND", b"")
+
+# Cached signature + IHDR chunk keyed by (width, height)
+_PNG_HEADER_CACHE = LRUCache(max_size=WIDTH_CACHE_SIZE)
+
+
+def _get_png_header(width: int, height: int) -> bytes:
+    """
+    Get (or build and cache) the PNG signature + IHDR chunk for an RGB image.
+
+    IHDR only depends on the image dimensions here (bit depth 8, color
+    type 2, no interlace), so it is identical for every row of a run.
+    """
+    header = _PNG_HEADER_CACHE.get((width, height))
+    if header is None:
+        # IHDR: width, height, bit depth 8, color type 2 (RGB), default
+        # compression/filter methods, no interlace
+        ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+        header = PNG_SIGNATURE + _png_chunk(b"IHDR", ihdr)
+        _PNG_HEADER_CACHE.set((width, height), header)
+    return header  # type: ignore[no-any-return]
+
+
+def _filter_none_scanlines(rgb_array: NDArray[np.uint8]) -> NDArray[np.uint8]:
+    """
+    Lay out (height, width, 3) RGB pixels as PNG scanlines with filter byte 0.
+
+    Returns a C-contiguous (height, 1 + width * 3) uint8 array whose rows
+    can be handed to zlib as-is, so no filter search or per-row copy is
+    needed afterwards.
+    """
+    height = rgb_array.shape[0]
+    scanlines = np.empty((height, 1 + rgb_array.shape[1] * 3), dtype=np.uint8)
+    scanlines[:, 0] = 0
+    scanlines[:, 1:] = rgb_array.reshape(height, -1)
+    return scanlines
+
+
+def _encode_png(rgb_array: NDArray[np.uint8]) -> bytes:
+    """
+    Assemble an 8-bit RGB PNG directly from a (height, width, 3) uint8 array.
+
+    Every scanline uses filter type 0 (None) and IDAT is compressed with
+    zlib at PNG_COMPRESS_LEVEL, skipping Pillow's filter heuristics. Only
+    IDAT is computed per call; the header and IEND chunk are cached.
+    """
+    height, width = rgb_array.shape[:2]
+
+    # Prefix each scanline with filter byte 0. zlib reads NumPy buffers
+    # directly, so pixel data is never round-tripped through tobytes()
+    raw: bytes | memoryview
+    if height == 1 and rgb_array.flags["C_CONTIGUOUS"]:
+        raw = b"\x00" + rgb_array.data.cast("B")
+    else:
+        raw = _filter_none_scanlines(rgb_array).data
+
+    return (
+        _get_png_header(width, height)
+        + _png_chunk(b"IDAT", zlib.compress(raw, PNG_COMPRESS_LEVEL))
+        + IEND_CHUNK
+    )
 
 
 def encode_to_png(rgb_array: NDArray[np.uint8]) -> bytes:
     """
     Encode RGB array to PNG bytes.
 
+    Writes the PNG chunks directly (filter type 0, zlib Z_BEST_SPEED)
+    instead of going through Pillow's optimize=True encoder, which is
+    wasted effort on single-row images.
+
     Args:
         rgb_array: RGB image array of shape (height, width, 3)
 
     Returns:
         bytes: PNG-encoded image data
 
+    Raises:
+        ValueError: If input is not a uint8 array of shape (height, width, 3)
+
     Example:
         >>> rgb = np.random.randint(0, 256, (1, 150, 3), dtype=np.uint8)
         >>> png_bytes = encode_to_png(rgb)
         >>> len(png_bytes) > 0
         True
     """
-    # Create PIL Image from RGB array (PIL infers mode='RGB' from uint8 3D array with shape[2]==3)
-    img = Image.fromarray(rgb_array)
+    if rgb_array.ndim != 3 or rgb_array.shape[2] != 3:
+        raise ValueError(f"Expected RGB array of shape (H, W, 3), got {rgb_array.shape}")
+    if rgb_array.dtype != np.uint8:
+        raise ValueError(f"Expected uint8 dtype, got {rgb_array.dtype}")
 
-    # Encode to PNG in memory
-    buffer = BytesIO()
-    img.save(buffer, format="PNG", optimize=True)
-    png_bytes = buffer.getvalue()
+    return _encode_png(rgb_array)
 
-    logger.debug(
-        "Encoded to PNG",
-        extra={"input_shape": rgb_array.shape, "output_size_bytes": len(png_bytes)},
-    )
 
-    return png_bytes
+def clip_to_uint8(values: NDArray) -> NDArray[np.uint8]:
+    """
+    Clamp pixel values to 0-255 and convert to uint8.
+
+    Integer arrays are clipped and cast directly (uint8 input is returned
+    as-is). Anything else goes through a float32 buffer, clipped in place,
+    which halves memory traffic compared to a float64 round trip.
+
+    Args:
+        values: Array of pixel values, any shape
+
+    Returns:
+        NDArray[np.uint8]: Clamped grayscale values with the same shape
+
+    Raises:
+        ValueError: If values cannot be converted to numbers
+
+    Example:
+        >>> clip_to_uint8(np.array([-5.0, 12.7, 300.0]))
+        array([  0,  12, 255], dtype=uint8)
+    """
+    if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.integer):
+        if values.dtype == np.uint8:
+            return cast(NDArray[np.uint8], values)
+        return cast(NDArray[np.uint8], np.clip(values, 0, 255).astype(np.uint8, copy=False))
+
+    # np.array (not asarray) so the in-place clip never touches caller data
+    arr = np.array(values, dtype=np.float32)
+    np.clip(arr, 0, 255, out=arr)
+    return arr.astype(np.uint8)
 
 
 def process_row_to_png(
-    row_data: NDArray[np.float64] | list[float], source_width: int = 200, target_width: int = 150
+    row_data: NDArray[np.float32] | NDArray[np.uint8],
+    source_width: int = 200,
+    target_width: int = 150,
 ) -> tuple[bytes, int, int]:
     """
     Complete pipeline: CSV row → resized colorized PNG.
@@ -286,7 +534,7 @@ def process_row_to_png(
     4. Encode to PNG bytes
 
     Args:
-        row_data: Array or list of pixel values (0-255 range)
+        row_data: Array of pixel values (0-255 range)
         source_width: Original width (default 200)
         target_width: Target width (default 150)
 
@@ -305,19 +553,22 @@ def process_row_to_png(
         True
     """
     # Convert to numpy array and ensure uint8 (0-255)
-    grayscale = np.array(row_data, dtype=np.float64)
-    grayscale = np.clip(grayscale, 0, 255).astype(np.uint8)
+    grayscale = clip_to_uint8(row_data)
 
     # Ensure we have expected source width
     if len(grayscale) != source_width:
         raise ValueError(f"Expected {source_width} pixel values, got {len(grayscale)}")
 
-    # Step 1: Resize grayscale row
-    resized_gray = resize_grayscale_row(grayscale, target_width)
+    # Step 1: Resize grayscale row (skipped when the width is unchanged)
+    if source_width == target_width:
+        resized_gray = grayscale
+    else:
+        resized_gray = resize_grayscale_row(grayscale, target_width)
 
     # Step 2: Apply colormap to get RGB
-    # Reshape to (1, target_width) for 2D image, then apply colormap
-    rgb = apply_colormap(resized_gray.reshape(1, -1))
+    # Reshape to (1, target_width) for 2D image, then gather into the
+    # thread-local RGB scratch buffer (no per-row allocation)
+    rgb = apply_colormap(resized_gray.reshape(1, -1), out=_get_rgb_scratch(target_width))
 
     # rgb shape is now (1, target_width, 3)
 
@@ -325,3 +576,357 @@ def process_row_to_png(
     png_bytes = encode_to_png(rgb)
 
     return png_bytes, target_width, 1
+
+
+# Memoized PNGs keyed by (source_width, target_width, uint8 row bytes)
+_png_cache = LRUCache(max_size=settings.png_cache_size)
+
+
+def get_png_cache_stats() -> dict:
+    """
+    Get hit/miss statistics of the duplicate-row PNG memo cache.
+
+    Returns:
+        dict: Same fields as LRUCache.stats() (hits, misses, hit_rate_percent, ...)
+    """
+    return _png_cache.stats()
+
+
+# Per-thread scratch buffers for the fused pipeline, keyed by target width
+# (bounded per thread by WIDTH_CACHE_SIZE)
+_scratch = threading.local()
+
+
+def _get_scratch(
+    target_width: int,
+) -> tuple[
+    NDArray[np.uint8],
+    NDArray[np.uint8],
+    NDArray[np.float32],
+    NDArray[np.float32],
+    NDArray[np.uint8],
+]:
+    """
+    Get this thread's scratch buffers for the per-row pipelines.
+
+    Args:
+        target_width: Output row width in pixels
+
+    Returns:
+        tuple: (gathered, gray, acc, tmp, rgb) where gathered/acc/tmp have
+        shape (target_width,), gray has shape (1, target_width) and rgb has
+        shape (1, target_width, 3)
+    """
+    buffers = getattr(_scratch, "buffers", None)
+    if buffers is None:
+        buffers = _scratch.buffers = LRUCache(max_size=WIDTH_CACHE_SIZE)
+
+    scratch = buffers.get(target_width)
+    if scratch is None:
+        scratch = (
+            np.empty(target_width, dtype=np.uint8),
+            np.empty((1, target_width), dtype=np.uint8),
+            np.empty(target_width, dtype=np.float32),
+            np.empty(target_width, dtype=np.float32),
+            np.empty((1, target_width, 3), dtype=np.uint8),
+        )
+        buffers.set(target_width, scratch)
+    return scratch  # type: ignore[no-any-return]
+
+
+def _get_rgb_scratch(target_width: int) -> NDArray[np.uint8]:
+    """Get this thread's reusable (1, target_width, 3) uint8 RGB buffer."""
+    return _get_scratch(target_width)[4]
+
+
+def process_row_to_png_fused(
+    row_data: NDArray[np.float32] | NDArray[np.uint8],
+    *,
+    out_buf: NDArray[np.uint8] | None = None,
+    source_width: int = 200,
+    target_width: int = 150,
+) -> tuple[bytes, int, int]:
+    """
+    Fused pipeline: CSV row → resized colorized PNG in a single pass.
+
+    Same output as process_row_to_png(), but resize, colormap and PNG
+    encoding share preallocated buffers instead of materializing a new
+    array at every step:
+    1. Linear resample into a thread-local grayscale scratch row
+    2. LUT gather straight into the RGB buffer (np.take with out=)
+    3. Encode the RGB buffer directly to PNG (no PIL Image)
+
+    Rows identical to one encoded earlier are served from the PNG memo
+    cache without recomputation.
+
+    Args:
+        row_data: Array of pixel values (0-255 range)
+        out_buf: Optional C-contiguous uint8 RGB scratch buffer of shape
+            (1, target_width, 3) to reuse across calls. A thread-local
+            buffer is used when omitted. Its contents after the call are
+            unspecified (it is not written on a cache hit).
+        source_width: Original width (default 200)
+        target_width: Target width (default 150)
+
+    Returns:
+        tuple: (png_bytes, width, height) as in process_row_to_png()
+
+    Raises:
+        ValueError: If the row length or out_buf layout is wrong
+
+    Example:
+        >>> rgb_buf = np.empty((1, 150, 3), dtype=np.uint8)
+        >>> for row in rows:
+        ...     png_bytes, width, height = process_row_to_png_fused(row, out_buf=rgb_buf)
+    """
+    # Convert to numpy array and ensure uint8 (0-255)
+    grayscale = clip_to_uint8(row_data)
+
+    if len(grayscale) != source_width:
+        raise ValueError(f"Expected {source_width} pixel values, got {len(grayscale)}")
+
+    gathered, gray, acc, tmp, rgb_scratch = _get_scratch(target_width)
+
+    if out_buf is None:
+        out_buf = rgb_scratch
+    elif (
+        out_buf.shape != (1, target_width, 3)
+        or out_buf.dtype != np.uint8
+        or not out_buf.flags["C_CONTIGUOUS"]
+    ):
+        raise ValueError(
+            f"out_buf must be a C-contiguous uint8 array of shape (1, {target_width}, 3), "
+            f"got {out_buf.dtype} {out_buf.shape}"
+        )
+
+    # Reuse the PNG of an identical row encoded earlier
+    key = (source_width, target_width, grayscale.tobytes())
+    cached = _png_cache.get(key)
+    if cached is not None:
+        return cached, target_width, 1
+
+    # Steps 1+2: Linear resample + colormap gather into the RGB buffer
+    if source_width == target_width:
+        # Nothing to resample: colorize the source row directly
+        apply_colormap(grayscale.reshape(1, -1), out=out_buf)
+    elif source_width == 1:
+        gray.fill(grayscale[0])
+        apply_colormap(gray, out=out_buf)
+    elif njit is not None:
+        # Single compiled pass, no intermediate grayscale row
+        i0, w0, w1 = _get_weights(source_width, target_width)
+        row_2d = np.ascontiguousarray(grayscale).reshape(1, -1)
+        _rows_to_rgb(row_2d, i0, w0, w1, COLORMAP_LUT, out_buf)
+    else:
+        i0, w0, w1 = _get_weights(source_width, target_width)
+        # i0 is already within [0, source_width - 2]; mode="clip" just
+        # lets np.take write into the scratch buffer without a temporary
+        np.take(grayscale, i0, out=gathered, mode="clip")
+        np.multiply(gathered, w0, out=acc)
+        # grayscale[1:][i0] == grayscale[i0 + 1], without allocating i0 + 1
+        np.take(grayscale[1:], i0, out=gathered, mode="clip")
+        np.multiply(gathered, w1, out=tmp)
+        np.add(acc, tmp, out=acc)
+        np.add(acc, 0.5, out=acc)
+        np.copyto(gray[0], acc, casting="unsafe")
+        apply_colormap(gray, out=out_buf)
+
+    # Step 3: Encode the RGB buffer
+    png_bytes = _encode_png(out_buf)
+    _png_cache.set(key, png_bytes)
+
+    return png_bytes, target_width, 1
+
+
+def render_raw_row(raw_gray: bytes, target_width: int = 150) -> tuple[bytes, int, int]:
+    """
+    Render a stored raw grayscale row to a colorized PNG at read time.
+
+    raw_gray is the uint8 source row as saved at ingestion (one byte per
+    pixel). Rendering goes through the fused pipeline, so repeated
+    requests for the same row and width are served from the PNG memo
+    cache.
+
+    Args:
+        raw_gray: Raw uint8 grayscale pixels (source width = len(raw_gray))
+        target_width: Output image width (default 150)
+
+    Returns:
+        tuple: (png_bytes, width, height)
+
+    Raises:
+        ValueError: If raw_gray is empty
+
+    Example:
+        >>> png_bytes, width, height = render_raw_row(bytes(200), target_width=300)
+        >>> width, height
+        (300, 1)
+    """
+    if not raw_gray:
+        raise ValueError("raw_gray must contain at least one pixel")
+
+    row = np.frombuffer(raw_gray, dtype=np.uint8)
+    return process_row_to_png_fused(row, source_width=len(row), target_width=target_width)
+
+
+def _encode_png_rows(rgb: NDArray[np.uint8]) -> list[bytes]:
+    """Encode each row of an (N, width, 3) RGB batch as its own 1-row PNG."""
+    # Frame the whole batch once; each scanline row is a contiguous view
+    # that zlib compresses directly (filter byte 0 already in place)
+    header = _get_png_header(rgb.shape[1], 1)
+    return [
+        header + _png_chunk(b"IDAT", zlib.compress(line, PNG_COMPRESS_LEVEL)) + IEND_CHUNK
+        for line in _filter_none_scanlines(rgb)
+    ]
+
+
+# Shared PNG encode pool, created on first use and sized from settings
+_encode_executor: ThreadPoolExecutor | None = None
+_encode_executor_lock = threading.Lock()
+
+
+def _get_encode_executor() -> ThreadPoolExecutor:
+    """
+    Get or create the process-wide PNG encode thread pool.
+
+    Reusing one pool avoids starting and joining threads for every batch,
+    which for small chunks costs as much as the encoding itself.
+    """
+    global _encode_executor
+
+    with _encode_executor_lock:
+        if _encode_executor is None:
+            _encode_executor = ThreadPoolExecutor(
+                max_workers=settings.encode_workers, thread_name_prefix="png-encode"
+            )
+        return _encode_executor
+
+
+def _encode_rows_uncached(
+    grayscale: NDArray[np.uint8], source_width: int, target_width: int, max_workers: int
+) -> list[bytes]:
+    """Resample, colorize and encode (N, source_width) uint8 rows without memoization."""
+    # Steps 1+2: Resample all rows and gather colors → (N, target_width, 3)
+    if source_width == target_width:
+        rgb = COLORMAP_LUT[grayscale]
+    elif source_width == 1:
+        rgb = COLORMAP_LUT[np.repeat(grayscale, target_width, axis=1)]
+    else:
+        i0, w0, w1 = _get_weights(source_width, target_width)
+        rgb = np.empty((len(grayscale), target_width, 3), dtype=np.uint8)
+        _rows_to_rgb(np.ascontiguousarray(grayscale), i0, w0, w1, COLORMAP_LUT, rgb)
+
+    # Step 3: Encode each row, optionally spread over the shared thread pool
+    workers = min(max_workers, len(rgb))
+    if workers <= 1:
+        return _encode_png_rows(rgb)
+
+    parts = _get_encode_executor().map(_encode_png_rows, np.array_split(rgb, workers))
+    return [png_bytes for part in parts for png_bytes in part]
+
+
+def process_rows_to_png(
+    rows: NDArray[np.float32] | NDArray[np.uint8],
+    source_width: int = 200,
+    target_width: int = 150,
+    max_workers: int = 1,
+) -> list[bytes]:
+    """
+    Batched pipeline: many CSV rows → resized colorized PNGs.
+
+    Clipping, resampling and the colormap gather run once over the whole
+    (N, source_width) batch on contiguous buffers; only the PNG encode
+    step loops per row. Each output image is target_width × 1.
+
+    Rows identical to one already encoded (in this batch or an earlier
+    one still in the PNG memo cache) reuse that PNG and skip all work.
+
+    With max_workers > 1 the batch is split into one contiguous slice per
+    worker and encoded on a shared thread pool of settings.encode_workers
+    threads (zlib releases the GIL while compressing). Output order always
+    matches input order.
+
+    Args:
+        rows: 2D array of pixel values (0-255 range), shape (N, source_width)
+        source_width: Original width (default 200)
+        target_width: Target width (default 150)
+        max_workers: Slices encoded in parallel on the pool (default 1 = serial)
+
+    Returns:
+        list[bytes]: PNG-encoded image per input row, in input order
+
+    Raises:
+        ValueError: If rows is not 2D or has the wrong number of columns
+
+    Example:
+        >>> rows = np.random.rand(500, 200) * 255
+        >>> pngs = process_rows_to_png(rows)
+        >>> len(pngs)
+        500
+    """
+    # Convert to numpy array and ensure uint8 (0-255)
+    grayscale = clip_to_uint8(rows)
+    if grayscale.ndim != 2:
+        raise ValueError(f"Expected 2D array of rows, got shape {grayscale.shape}")
+    if grayscale.shape[1] != source_width:
+        raise ValueError(f"Expected {source_width} pixel values, got {grayscale.shape[1]}")
+
+    grayscale = np.ascontiguousarray(grayscale)
+
+    # Reuse PNGs of rows seen before (flat zones repeat identical rows).
+    # Keys are the exact row bytes, so a hit never returns the wrong image.
+    keys = [(source_width, target_width, row.tobytes()) for row in grayscale]
+    pngs: list[bytes | None] = [None] * len(keys)
+    pending: dict[tuple[int, int, bytes], int] = {}  # key → first row to encode
+    duplicates = 0
+    for i, key in enumerate(keys):
+        if key in pending:
+            duplicates += 1
+            continue
+        cached = _png_cache.get(key)
+        if cached is None:
+            pending[key] = i
+        else:
+            pngs[i] = cached
+    _png_cache.record_hits(duplicates)
+
+    if not pending:
+        return pngs  # type: ignore[return-value]
+
+    encoded = dict(
+        zip(
+            pending,
+            _encode_rows_uncached(
+                grayscale[list(pending.values())], source_width, target_width, max_workers
+            ),
+            strict=True,
+        )
+    )
+    for key, png_bytes in encoded.items():
+        _png_cache.set(key, png_bytes)
+
+    return [
+        cached if cached is not None else encoded[key]
+        for key, cached in zip(keys, pngs, strict=True)
+    ]
+
+
+def get_backend_info() -> dict:
+    """
+    Report which optional acceleration backends are active.
+
+    Only resize_gray_width() goes through Pillow (and so benefits from
+    Pillow-SIMD); the ingestion pipelines use NumPy/Numba and zlib.
+
+    Returns:
+        dict: pillow_version, pillow_simd and numba_jit flags
+
+    Example:
+        >>> get_backend_info()
+        {'pillow_version': '11.0.0', 'pillow_simd': False, 'numba_jit': True}
+    """
+    return {
+        "pillow_version": PIL.__version__,
+        "pillow_simd": PILLOW_SIMD,
+        "numba_jit": njit is not None,
+    }
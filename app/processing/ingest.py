@@ -9,13 +9,19 @@ This module handles:
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core import get_logger, settings
 from app.db import Frame, get_db_context
-from app.processing import process_row_to_png
+from app.processing import (
+    clip_to_uint8,
+    get_png_cache_stats,
+    process_row_to_png_fused,
+    process_rows_to_png,
+)
 
 logger = get_logger(__name__)
 
@@ -88,7 +94,10 @@ def read_csv_chunks(csv_path: str | Path, chunk_size: int = 500):
     """
     Stream CSV file in chunks to avoid loading entire file into memory.
 
-    Uses pandas chunked reading for memory efficiency.
+    Uses pandas chunked reading with the C parser, then casts pixel columns
+    to float32 so they arrive ready for process_rows_to_png. Depth stays
+    float64 to keep primary keys exact. A chunk with a non-numeric cell is
+    yielded uncast, so process_chunk_to_frames() can skip just the bad rows.
 
     Args:
         csv_path: Path to CSV file
@@ -107,8 +116,25 @@ def read_csv_chunks(csv_path: str | Path, chunk_size: int = 500):
         "Starting CSV chunked read", extra={"csv_path": str(csv_path), "chunk_size": chunk_size}
     )
 
-    # Use pandas chunk reader
-    for chunk_num, chunk_df in enumerate(pd.read_csv(csv_path, chunksize=chunk_size), start=1):
+    # Depth column stays float64; pixel columns are cast to float32
+    columns = pd.read_csv(csv_path, nrows=0).columns
+    dtypes: dict[str, type[np.floating]] = dict.fromkeys(columns[1:], np.float32)
+    dtypes[columns[0]] = np.float64
+
+    # Casting per chunk (rather than via read_csv(dtype=...)) keeps one bad
+    # cell from aborting the whole read
+    reader = pd.read_csv(csv_path, chunksize=chunk_size, engine="c")
+    for chunk_num, chunk_df in enumerate(reader, start=1):
+        try:
+            chunk_df = chunk_df.astype(dtypes)
+        except ValueError as e:
+            logger.warning(
+                "Non-numeric values in CSV chunk, leaving it uncast",
+                extra={"chunk_num": chunk_num, "error": str(e)},
+            )
+            yield chunk_df
+            continue
+
         logger.debug(
             "Read CSV chunk",
             extra={
@@ -121,24 +147,31 @@ def read_csv_chunks(csv_path: str | Path, chunk_size: int = 500):
 
 
 async def process_chunk_to_frames(
-    chunk_df: pd.DataFrame, source_width: int = 200, target_width: int = 150
+    chunk_df: pd.DataFrame,
+    source_width: int = 200,
+    target_width: int = 150,
+    max_workers: int | None = None,
 ) -> list[dict]:
     """
     Process a chunk of CSV rows into Frame data dictionaries.
 
-    For each row:
-    1. Extract depth value (first column)
-    2. Extract pixel values (remaining columns)
-    3. Process: resize + colormap + PNG encode
-    4. Create Frame dict ready for DB insert
+    Steps:
+    1. Extract depth values (first column) and pixel values (remaining columns)
+    2. Process the whole chunk at once: resize + colormap + PNG encode
+       (encoding is spread over max_workers threads)
+    3. Create Frame dicts ready for DB insert
+
+    If the batched conversion fails (e.g. a non-numeric cell), the chunk is
+    reprocessed row by row so only the offending rows are skipped.
 
     Args:
         chunk_df: DataFrame chunk with depth + pixel columns
         source_width: Expected number of pixel columns (default 200)
         target_width: Target image width after resize (default 150)
+        max_workers: PNG encoding threads (default from settings.encode_workers)
 
     Returns:
-        list[dict]: Frame dictionaries with depth, image_png, width, height
+        list[dict]: Frame dictionaries with depth, image_png, raw_gray, width, height
 
     Raises:
         ValueError: If pixel column count doesn't match source_width
@@ -152,22 +185,55 @@ async def process_chunk_to_frames(
     if len(pixel_cols) != source_width:
         raise ValueError(f"Expected {source_width} pixel columns, got {len(pixel_cols)}")
 
-    # Process each row
+    # Fast path: vectorized processing of every row in the chunk
+    try:
+        depths = chunk_df[depth_col].astype(float).tolist()
+        # to_numpy() keeps uint8/float32 columns as-is; clip_to_uint8 does the rest
+        gray_rows = clip_to_uint8(chunk_df[pixel_cols].to_numpy())
+        png_list = process_rows_to_png(
+            gray_rows,
+            source_width=source_width,
+            target_width=target_width,
+            max_workers=max_workers or settings.encode_workers,
+        )
+    except Exception as e:
+        logger.warning(
+            "Batch processing failed, falling back to per-row processing",
+            extra={"rows": len(chunk_df), "error": str(e)},
+        )
+    else:
+        frames = [
+            {
+                "depth": depth,
+                "image_png": png_bytes,
+                "raw_gray": gray_row.tobytes(),
+                "width": target_width,
+                "height": 1,
+            }
+            for depth, png_bytes, gray_row in zip(depths, png_list, gray_rows, strict=True)
+        ]
+
+        logger.info("Processed chunk", extra={"rows_processed": len(frames), "rows_failed": 0})
+
+        return frames
+
+    # Slow path: process each row individually, skipping rows that fail
     for idx, row in chunk_df.iterrows():
         try:
             # Extract depth and pixel values
             depth = float(row[depth_col])
-            pixel_values = row[pixel_cols].values
+            gray_row = clip_to_uint8(row[pixel_cols].values)
 
             # Process to PNG
-            png_bytes, width, height = process_row_to_png(
-                pixel_values, source_width=source_width, target_width=target_width
+            png_bytes, width, height = process_row_to_png_fused(
+                gray_row, source_width=source_width, target_width=target_width
             )
 
             # Create Frame dict
             frame_data = {
                 "depth": depth,
                 "image_png": png_bytes,
+                "raw_gray": gray_row.tobytes(),
                 "width": width,
                 "height": height,
             }
@@ -218,6 +284,7 @@ async def upsert_frames(db: AsyncSession, frames: list[dict]) -> int:
         index_elements=["depth"],
         set_={
             "image_png": stmt.excluded.image_png,
+            "raw_gray": stmt.excluded.raw_gray,
             "width": stmt.excluded.width,
             "height": stmt.excluded.height,
             "updated_at": stmt.excluded.updated_at,
@@ -342,5 +409,6 @@ async def ingest_csv(
     }
 
     logger.info("CSV ingestion complete", extra=result)
+    logger.info("PNG memo cache", extra=get_png_cache_stats())
 
     return result
@@ -40,6 +40,7 @@ from pathlib import Path
 from app.core import get_logger, settings, setup_logging
 from app.db import get_db_context
 from app.db.operations import count_frames, get_depth_range, upsert_frames_batch
+from app.processing import get_backend_info
 from app.processing.ingest import explore_csv, process_chunk_to_frames, read_csv_chunks
 
 logger = get_logger(__name__)
@@ -327,6 +328,12 @@ Exit Codes:
     print(f"Progress Interval: {args.progress_interval} frames")
     print(f"Log Level:         {args.log_level}")
     print(f"Database:          {settings.database_url}")
+    backends = get_backend_info()
+    print(
+        f"Image Backends:    Pillow {backends['pillow_version']} "
+        f"(SIMD: {'yes' if backends['pillow_simd'] else 'no'}), "
+        f"Numba JIT: {'yes' if backends['numba_jit'] else 'no'}"
+    )
     print(f"{'='*70}\n")
 
     try:
@@ -2,7 +2,7 @@
 
 import asyncio
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from app.core import setup_logging
 from app.db import Frame, get_db_context
@@ -17,25 +17,31 @@ async def main():
     print("=" * 70)
 
     async with get_db_context() as db:
-        # Count total frames
-        result = await db.execute(select(Frame))
-        frames = result.scalars().all()
+        # Summary statistics in a single aggregate query (no blobs loaded)
+        result = await db.execute(
+            select(
+                func.count(),
+                func.min(Frame.depth),
+                func.max(Frame.depth),
+                func.sum(func.length(Frame.image_png)),
+                func.count(Frame.raw_gray),
+            ).select_from(Frame)
+        )
+        total, depth_min, depth_max, total_png_bytes, raw_rows = result.one()
 
-        print(f"\nTotal frames in database: {len(frames)}")
+        print(f"\nTotal frames in database: {total:,}")
 
-        if frames:
-            print("\nFrame Details:")
+        if total:
+            print("\nSummary:")
             print("-" * 70)
-            for frame in frames:
-                print(
-                    f"Depth: {frame.depth:7.2f} | "
-                    f"Dimensions: {frame.width}x{frame.height} | "
-                    f"Size: {len(frame.image_png):,} bytes | "
-                    f"Created: {frame.created_at}"
-                )
-
-            # Show first frame details
-            first_frame = frames[0]
+            print(f"Depth range:     {depth_min:.2f} - {depth_max:.2f}")
+            print(f"Total PNG size:  {total_png_bytes:,} bytes")
+            print(f"Avg PNG size:    {total_png_bytes / total:,.1f} bytes")
+            print(f"Raw rows stored: {raw_rows:,} / {total:,}")
+
+            # Fetch only the first frame in full
+            result = await db.execute(select(Frame).order_by(Frame.depth).limit(1))
+            first_frame = result.scalar_one()
             print("\n" + "=" * 70)
             print("FIRST FRAME DETAILS")
             print("=" * 70)
@@ -4,18 +4,23 @@ Integration tests for API endpoints.
 Tests for:
 - GET /health: Health check endpoint
 - GET /frames: Frame retrieval with filtering and pagination
+- GET /frames/{depth}/image.png: Read-time PNG rendering with ETags
 - POST /frames/reload: Admin reload endpoint with auth
 """
 
 import base64
+from io import BytesIO
 
+import numpy as np
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
+from PIL import Image
 from sqlalchemy import delete
 
 from app.db import Frame, get_db_context
 from app.db.operations import upsert_frame
+from app.processing import process_row_to_png
 
 
 class TestHealthEndpoint:
@@ -259,6 +264,75 @@ class TestReloadEndpoint:
             assert "detail" in data
 
 
+class TestFrameImageEndpoint:
+    """Tests for GET /frames/{depth}/image.png endpoint."""
+
+    RAW_ROW = bytes(range(200))
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup_test_data(self):
+        """Store one frame with a raw row and one legacy frame without."""
+        async with get_db_context() as session:
+            await session.execute(delete(Frame))
+            await upsert_frame(session, 100.0, 150, 1, b"PNG100", raw_gray=self.RAW_ROW)
+            await upsert_frame(session, 200.0, 150, 1, b"LEGACY")
+            await session.commit()
+
+        yield
+
+        async with get_db_context() as session:
+            await session.execute(delete(Frame))
+            await session.commit()
+
+    def test_renders_raw_row(self, client: TestClient):
+        """Default width renders the raw row through the ingestion pipeline."""
+        response = client.get("/frames/100.0/image.png")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["cache-control"] == "no-cache"
+        expected, _, _ = process_row_to_png(np.frombuffer(self.RAW_ROW, dtype=np.uint8))
+        assert response.content == expected
+
+    def test_custom_width(self, client: TestClient):
+        """Width query parameter controls the rendered size and the ETag."""
+        default = client.get("/frames/100.0/image.png")
+        wide = client.get("/frames/100.0/image.png", params={"width": 300})
+
+        assert wide.status_code == 200
+        assert Image.open(BytesIO(wide.content)).size == (300, 1)
+        assert wide.headers["etag"] != default.headers["etag"]
+
+    def test_if_none_match_returns_304(self, client: TestClient):
+        """A matching ETag yields 304 with no body."""
+        etag = client.get("/frames/100.0/image.png").headers["etag"]
+
+        response = client.get("/frames/100.0/image.png", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_legacy_frame_stored_width(self, client: TestClient):
+        """Frames without a raw row serve their stored PNG at the stored width."""
+        response = client.get("/frames/200.0/image.png")
+
+        assert response.status_code == 200
+        assert response.content == b"LEGACY"
+
+    def test_legacy_frame_other_width(self, client: TestClient):
+        """Frames without a raw row cannot be rendered at other widths."""
+        response = client.get("/frames/200.0/image.png", params={"width": 300})
+
+        assert response.status_code == 409
+
+    def test_missing_frame(self, client: TestClient):
+        """Unknown depths return 404."""
+        response = client.get("/frames/999.0/image.png")
+
+        assert response.status_code == 404
+
+
 class TestOpenAPIDocumentation:
     """Tests for OpenAPI documentation endpoints."""
 
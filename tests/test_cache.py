@@ -12,6 +12,7 @@ from typing import List
 import pytest
 
 from app.core.cache import (
+    LRUCache,
     TTLCache,
     cache_frame,
     cache_range,
@@ -123,6 +124,42 @@ class TestTTLCache:
         assert cache.get("key1") is None
 
 
+class TestLRUCache:
+    """Test LRUCache used for PNG memoization."""
+
+    def test_basic_operations_and_eviction(self):
+        """Least recently used entry is evicted when full."""
+        cache = LRUCache(max_size=2)
+        cache.set(b"a", 1)
+        cache.set(b"b", 2)
+        cache.get(b"a")  # Touch a so b is oldest
+        cache.set(b"c", 3)
+
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") == 1
+        assert cache.get(b"c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_zero_size_disables_caching(self):
+        """max_size=0 never stores entries."""
+        cache = LRUCache(max_size=0)
+        cache.set(b"a", 1)
+
+        assert cache.get(b"a") is None
+        assert cache.stats()["size"] == 0
+
+    def test_record_hits(self):
+        """Externally served hits are counted in stats."""
+        cache = LRUCache(max_size=2)
+        cache.get(b"missing")
+        cache.record_hits(3)
+
+        stats = cache.stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 1
+        assert stats["hit_rate_percent"] == 75.0
+
+
 class TestCacheDecorators:
     """Test cache decorators for functions."""
 
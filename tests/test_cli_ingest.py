@@ -86,8 +86,13 @@ class TestIngestCSV:
         )
         df.to_csv(csv_file, index=False)
 
-        # Mock process_row_to_png to fail on second row
-        with patch("app.cli.ingest.process_row_to_png") as mock_process:
+        # Force the per-row fallback, then fail on second row
+        with (
+            patch(
+                "app.processing.ingest.process_rows_to_png", side_effect=ValueError("Batch error")
+            ),
+            patch("app.processing.ingest.process_row_to_png_fused") as mock_process,
+        ):
             mock_process.side_effect = [
                 (b"PNG_DATA_1", 150, 1),
                 ValueError("Processing error"),
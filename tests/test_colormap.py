@@ -221,6 +221,16 @@ class TestApplyColormapWrapper:
         # 192 → yellow
         np.testing.assert_array_equal(rgb[0, 1], [255, 215, 0])
 
+    def test_out_buffer_reused(self):
+        """apply_colormap(out=...) writes into and returns the given buffer."""
+        gray = np.array([[0, 128, 255]], dtype=np.uint8)
+        out = np.zeros((1, 3, 3), dtype=np.uint8)
+
+        rgb = apply_colormap(gray, out=out)
+
+        assert rgb is out
+        np.testing.assert_array_equal(out, apply_lut(gray, COLORMAP_LUT))
+
 
 class TestIntegration:
     """Integration tests combining LUT generation and application."""
@@ -205,6 +205,15 @@ class TestConfigUncovered:
         # These should all work without errors
         assert True
 
+    def test_encode_workers_default_capped(self):
+        """Hosts with more than 64 CPUs still get a valid default."""
+        from unittest.mock import patch
+
+        from app.core.config import Settings
+
+        with patch("app.core.config.os.cpu_count", return_value=128):
+            assert Settings().encode_workers == 64
+
 
 class TestDBModelsUncovered:
     """Test uncovered lines in db/models.py."""
@@ -306,6 +306,24 @@ class TestGetFramesByDepthRange:
 
         assert [f.depth for f in frames] == [100.0, 150.0, 200.0, 300.0]
 
+    async def test_range_query_skips_raw_gray(
+        self, db_session: AsyncSession, sample_png_bytes: bytes
+    ):
+        """Listings load image_png but leave the raw_gray blob unloaded."""
+        from sqlalchemy import inspect
+
+        from app.core import clear_all_caches
+
+        clear_all_caches()
+        await upsert_frame(db_session, 100.0, 150, 1, sample_png_bytes, raw_gray=bytes(200))
+        await db_session.commit()
+        db_session.expunge_all()
+
+        (frame,) = await get_frames_by_depth_range(db_session)
+
+        assert frame.image_png == sample_png_bytes
+        assert "raw_gray" in inspect(frame).unloaded
+
 
 class TestCountFrames:
     """Tests for count_frames() function."""
@@ -515,5 +533,32 @@ class TestTransactionManagement:
         assert count == 0
 
 
+class TestSchemaMigration:
+    """Test that init_db adds columns missing from older tables."""
+
+    def test_adds_raw_gray_column(self, tmp_path):
+        """A frames table created before raw_gray existed gains the column."""
+        from sqlalchemy import create_engine, inspect, text
+
+        from app.db.session import _add_missing_columns
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE frames (depth FLOAT PRIMARY KEY, image_png BLOB NOT NULL, "
+                    "width INTEGER NOT NULL, height INTEGER NOT NULL, "
+                    "created_at DATETIME NOT NULL, updated_at DATETIME)"
+                )
+            )
+            _add_missing_columns(conn)
+            _add_missing_columns(conn)  # Idempotent
+
+            columns = {column["name"] for column in inspect(conn).get_columns("frames")}
+
+        engine.dispose()
+        assert "raw_gray" in columns
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s", "--tb=short"])
@@ -6,6 +6,7 @@ with deterministic inputs and expected outputs.
 """
 
 import base64
+import zlib
 from io import BytesIO
 
 import numpy as np
@@ -15,7 +16,11 @@ from PIL import Image
 from app.processing.image import (
     apply_lut,
     encode_to_png,
+    get_png_cache_stats,
     make_colormap_lut,
+    process_row_to_png,
+    process_row_to_png_fused,
+    process_rows_to_png,
     resize_grayscale_row,
 )
 
@@ -241,6 +246,20 @@ class TestResizeGrayscaleRow:
 class TestEncodeToPNG:
     """Test PNG encoding function (RGB only)."""
 
+    def test_scanlines_use_filter_none(self):
+        """Every scanline (single and batched rows) carries filter byte 0."""
+        rgb = np.random.RandomState(7).randint(0, 256, (4, 150, 3), dtype=np.uint8)
+        rows = np.random.RandomState(8).randint(0, 256, (3, 200), dtype=np.uint8)
+
+        for png_bytes in [encode_to_png(rgb), *process_rows_to_png(rows)]:
+            # Single IDAT chunk follows the 8-byte signature and 25-byte IHDR
+            idat_len = int.from_bytes(png_bytes[33:37], "big")
+            assert png_bytes[37:41] == b"IDAT"
+            raw = zlib.decompress(png_bytes[41 : 41 + idat_len])
+            height = int.from_bytes(png_bytes[20:24], "big")
+            stride = len(raw) // height
+            assert all(raw[i * stride] == 0 for i in range(height))
+
     def test_encode_rgb(self):
         """Encode RGB image to PNG."""
         rgb = np.zeros((2, 3, 3), dtype=np.uint8)
@@ -305,6 +324,49 @@ class TestEncodeToPNG:
         assert img.size == (1, 1)
         assert img.mode == "RGB"
 
+    def test_encode_multirow_roundtrip(self):
+        """Multi-row images decode back to the same pixels."""
+        original = np.random.RandomState(1).randint(0, 256, (4, 9, 3), dtype=np.uint8)
+
+        decoded = np.array(Image.open(BytesIO(encode_to_png(original))))
+
+        np.testing.assert_array_equal(decoded, original)
+
+    def test_encode_non_contiguous_roundtrip(self):
+        """Strided (non C-contiguous) views encode the same pixels."""
+        base = np.random.RandomState(2).randint(0, 256, (1, 20, 3), dtype=np.uint8)
+        view = base[:, ::-1]
+
+        decoded = np.array(Image.open(BytesIO(encode_to_png(view))))
+
+        np.testing.assert_array_equal(decoded, view)
+
+    def test_encode_header_fields(self):
+        """IHDR declares 8-bit RGB with the array's dimensions."""
+        rgb = np.zeros((1, 150, 3), dtype=np.uint8)
+
+        png_bytes = encode_to_png(rgb)
+
+        assert png_bytes[12:16] == b"IHDR"
+        assert int.from_bytes(png_bytes[16:20], "big") == 150  # width
+        assert int.from_bytes(png_bytes[20:24], "big") == 1  # height
+        assert png_bytes[24:26] == b"\x08\x02"  # bit depth 8, color type RGB
+        assert png_bytes.endswith(b"IEND\xaeB`\x82")
+
+    def test_header_cached_per_size(self):
+        """Signature + IHDR is built once per (width, height)."""
+        from app.processing.image import _get_png_header
+
+        assert _get_png_header(150, 1) is _get_png_header(150, 1)
+        assert _get_png_header(150, 1) != _get_png_header(75, 1)
+
+    def test_encode_rejects_non_rgb(self):
+        """Only (H, W, 3) uint8 arrays are accepted."""
+        with pytest.raises(ValueError, match="Expected RGB array"):
+            encode_to_png(np.zeros((1, 150), dtype=np.uint8))
+        with pytest.raises(ValueError, match="Expected uint8 dtype"):
+            encode_to_png(np.zeros((1, 150, 3), dtype=np.float32))
+
 
 class TestImagePipelineIntegration:
     """Test complete image processing pipeline."""
@@ -372,6 +434,156 @@ class TestImagePipelineIntegration:
         assert png1 == png2
 
 
+class TestInputConversion:
+    """Test pixel value conversion at the start of the row pipeline."""
+
+    def test_integer_input_clipped(self):
+        """Out-of-range integer input is clamped like float input."""
+        ints = np.array([-10, 0, 128, 255, 400] * 40, dtype=np.int64)
+
+        assert process_row_to_png(ints) == process_row_to_png(ints.astype(np.float64))
+
+    def test_float_input_not_mutated(self):
+        """Clipping happens on a private copy of the caller's data."""
+        row = np.linspace(-50, 300, 200, dtype=np.float32)
+        original = row.copy()
+
+        process_row_to_png(row)
+
+        np.testing.assert_array_equal(row, original)
+
+
+class TestFusedPipeline:
+    """Test the fused single-pass row → PNG pipeline."""
+
+    def test_matches_unfused_pipeline(self):
+        """Fused pipeline should produce the same PNG as process_row_to_png."""
+        rng = np.random.RandomState(7)
+
+        for _ in range(5):
+            row = rng.rand(200) * 300 - 20  # Includes out-of-range values
+            assert process_row_to_png_fused(row) == process_row_to_png(row)
+
+    def test_reuses_out_buf(self):
+        """Caller-provided RGB scratch buffer yields the colorized row."""
+        row = np.full(200, 255, dtype=np.uint8)
+        rgb_buf = np.zeros((1, 150, 3), dtype=np.uint8)
+
+        png_bytes, width, height = process_row_to_png_fused(row, out_buf=rgb_buf)
+
+        assert (width, height) == (150, 1)
+        decoded = np.array(Image.open(BytesIO(png_bytes)))
+        assert np.all(decoded == make_colormap_lut()[255])
+
+    def test_read_only_input(self):
+        """Read-only rows (e.g. np.frombuffer over bytes) are accepted."""
+        row = np.frombuffer(bytes(range(200)), dtype=np.uint8)
+
+        png_bytes, _, _ = process_row_to_png_fused(row)
+
+        assert png_bytes == process_row_to_png(row)[0]
+
+    def test_rejects_bad_out_buf(self):
+        """Wrongly shaped buffers are rejected."""
+        row = np.zeros(200, dtype=np.uint8)
+
+        with pytest.raises(ValueError, match="out_buf"):
+            process_row_to_png_fused(row, out_buf=np.zeros((1, 100, 3), dtype=np.uint8))
+
+    def test_rejects_wrong_width(self):
+        """Rows with the wrong pixel count are rejected."""
+        with pytest.raises(ValueError, match="Expected 200 pixel values"):
+            process_row_to_png_fused(np.zeros(199))
+
+
+class TestBatchPipeline:
+    """Test the batched rows → PNG pipeline."""
+
+    def test_matches_per_row_pipeline(self):
+        """Each batched PNG equals the per-row PNG for the same input."""
+        rows = np.random.RandomState(3).rand(20, 200) * 300 - 20
+
+        pngs = process_rows_to_png(rows)
+
+        assert len(pngs) == 20
+        for row, png_bytes in zip(rows, pngs, strict=True):
+            assert png_bytes == process_row_to_png(row)[0]
+
+    def test_threaded_encoding_preserves_order(self):
+        """Encoding on a thread pool returns the same PNGs in the same order."""
+        from app.processing.image import _png_cache
+
+        rows = np.random.RandomState(5).rand(37, 200) * 255
+        _png_cache.clear()  # Every row must go through the pool, not the memo
+
+        pngs = process_rows_to_png(rows, max_workers=4)
+
+        for row, png_bytes in zip(rows, pngs, strict=True):
+            assert png_bytes == process_row_to_png(row)[0]
+
+    def test_kernel_matches_numpy_reference(self):
+        """Resize + colormap kernel (Numba when installed) matches the NumPy path."""
+        from app.processing.image import (
+            COLORMAP_LUT,
+            _get_weights,
+            _rows_to_rgb,
+            _rows_to_rgb_numpy,
+        )
+
+        rows = np.random.RandomState(9).randint(0, 256, (64, 200), dtype=np.uint8)
+        i0, w0, w1 = _get_weights(200, 150)
+        fast = np.empty((64, 150, 3), dtype=np.uint8)
+        reference = np.empty((64, 150, 3), dtype=np.uint8)
+
+        _rows_to_rgb(rows, i0, w0, w1, COLORMAP_LUT, fast)
+        _rows_to_rgb_numpy(rows, i0, w0, w1, COLORMAP_LUT, reference)
+
+        np.testing.assert_array_equal(fast, reference)
+
+    def test_duplicate_rows_memoized(self):
+        """Repeated rows reuse one PNG, within a batch and across calls."""
+        rows = np.random.RandomState(5).randint(0, 256, size=(3, 200)).astype(np.uint8)
+        batch = rows[[0, 1, 0, 2, 1]]
+        hits_before = get_png_cache_stats()["hits"]
+
+        pngs = process_rows_to_png(batch)
+
+        assert pngs[0] is pngs[2]
+        assert pngs[1] is pngs[4]
+        assert pngs[0] == process_row_to_png(rows[0])[0]
+        assert get_png_cache_stats()["hits"] >= hits_before + 2
+
+        again = process_rows_to_png(rows[:1])
+        assert again[0] is pngs[0]
+        assert process_row_to_png_fused(rows[0])[0] is pngs[0]
+
+    def test_empty_batch(self):
+        """Zero rows produce zero PNGs."""
+        assert process_rows_to_png(np.empty((0, 200))) == []
+
+    def test_same_width_skips_resize(self):
+        """Equal widths colorize the source row unchanged in every pipeline."""
+        from app.processing.image import _png_cache
+
+        rows = np.random.RandomState(9).randint(0, 256, size=(2, 200)).astype(np.uint8)
+
+        batch = process_rows_to_png(rows, source_width=200, target_width=200)
+        _png_cache.clear()  # Exercise the fused path rather than the memo
+
+        for row, png_bytes in zip(rows, batch, strict=True):
+            decoded = np.array(Image.open(BytesIO(png_bytes)))
+            np.testing.assert_array_equal(decoded[0], make_colormap_lut()[row])
+            assert process_row_to_png(row, 200, 200)[0] == png_bytes
+            assert process_row_to_png_fused(row, source_width=200, target_width=200)[0] == png_bytes
+
+    def test_rejects_wrong_shape(self):
+        """Input must be 2D with source_width columns."""
+        with pytest.raises(ValueError, match="Expected 2D array"):
+            process_rows_to_png(np.zeros(200))
+        with pytest.raises(ValueError, match="Expected 200 pixel values"):
+            process_rows_to_png(np.zeros((3, 199)))
+
+
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
@@ -421,3 +633,19 @@ class TestEdgeCases:
 
         # Should have variation (not all same value)
         assert len(np.unique(resized)) > 1
+
+
+class TestBackendInfo:
+    """Test acceleration backend reporting."""
+
+    def test_reports_backends(self):
+        """Backend info reports Pillow version and boolean flags."""
+        import PIL
+
+        from app.processing import get_backend_info
+
+        info = get_backend_info()
+
+        assert info["pillow_version"] == PIL.__version__
+        assert isinstance(info["pillow_simd"], bool)
+        assert isinstance(info["numba_jit"], bool)
@@ -11,6 +11,7 @@ These tests cover:
 
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -114,6 +115,42 @@ class TestReadCSVChunks:
         assert len(chunks[2]) == 3
         assert len(chunks[3]) == 1
 
+    def test_read_csv_chunks_dtypes(self, tmp_path):
+        """Depth parses as float64, pixel columns as float32."""
+        csv_file = tmp_path / "test.csv"
+        df = pd.DataFrame(
+            {
+                "depth": [9000.1, 9000.2],
+                **{f"col{i}": [i % 256] * 2 for i in range(1, 201)},
+            }
+        )
+        df.to_csv(csv_file, index=False)
+
+        (chunk,) = read_csv_chunks(csv_file, chunk_size=10)
+
+        assert chunk["depth"].dtype == np.float64
+        assert chunk["depth"].tolist() == [9000.1, 9000.2]
+        assert (chunk.dtypes.iloc[1:] == np.float32).all()
+
+    @pytest.mark.asyncio
+    async def test_read_csv_chunks_non_numeric_cell(self, tmp_path):
+        """A bad cell leaves its chunk uncast; only that row is dropped."""
+        csv_file = tmp_path / "test.csv"
+        df = pd.DataFrame(
+            {
+                "depth": [100.0, 200.0, 300.0],
+                **{f"col{i}": [i % 256] * 3 for i in range(1, 201)},
+            }
+        )
+        df["col5"] = df["col5"].astype(object)
+        df.loc[1, "col5"] = "bad"
+        df.to_csv(csv_file, index=False)
+
+        (chunk,) = read_csv_chunks(csv_file, chunk_size=10)
+        frames = await process_chunk_to_frames(chunk)
+
+        assert [f["depth"] for f in frames] == [100.0, 300.0]
+
     def test_read_csv_chunks_single_chunk(self, tmp_path):
         """Test reading with chunk size larger than file."""
         csv_file = tmp_path / "test.csv"
@@ -168,6 +205,24 @@ class TestProcessChunkToFrames:
         assert frames[0]["width"] == 150
         assert frames[0]["height"] == 1
         assert isinstance(frames[0]["image_png"], bytes)
+        assert frames[1]["raw_gray"] == bytes((i + 50) % 256 for i in range(1, 201))
+
+    @pytest.mark.asyncio
+    async def test_process_chunk_thread_pool(self):
+        """Frames encoded on the thread pool keep their depth → PNG pairing."""
+        from app.processing import process_row_to_png
+        from app.processing.image import _png_cache
+
+        pixels = np.random.RandomState(7).randint(0, 256, (23, 200))
+        df = pd.DataFrame(pixels, columns=[f"col{i}" for i in range(1, 201)])
+        df.insert(0, "depth", [float(d) for d in range(23)])
+        _png_cache.clear()
+
+        frames = await process_chunk_to_frames(df, max_workers=4)
+
+        assert [f["depth"] for f in frames] == df["depth"].tolist()
+        for frame, row in zip(frames, pixels, strict=True):
+            assert frame["image_png"] == process_row_to_png(row)[0]
 
     @pytest.mark.asyncio
     async def test_process_chunk_wrong_column_count(self):
@@ -208,8 +263,14 @@ class TestProcessChunkToFrames:
             }
         )
 
-        # Mock process_row_to_png to fail on second row
-        with patch("app.processing.ingest.process_row_to_png") as mock_process:
+        # Force the per-row fallback, then fail on second row
+        with (
+            patch(
+                "app.processing.ingest.process_rows_to_png",
+                side_effect=ValueError("Batch error"),
+            ),
+            patch("app.processing.ingest.process_row_to_png_fused") as mock_process,
+        ):
             mock_process.side_effect = [
                 (b"PNG1", 150, 1),
                 ValueError("Processing error"),
@@ -223,6 +284,22 @@ class TestProcessChunkToFrames:
             assert frames[0]["depth"] == 100.0
             assert frames[1]["depth"] == 300.0
 
+    @pytest.mark.asyncio
+    async def test_process_chunk_skips_non_numeric_row(self):
+        """A non-numeric cell only drops its own row (per-row fallback)."""
+        df = pd.DataFrame(
+            {
+                "depth": [100.0, 200.0, 300.0],
+                **{f"col{i}": [i % 256, i % 256, i % 256] for i in range(1, 201)},
+            }
+        )
+        df["col5"] = df["col5"].astype(object)
+        df.loc[1, "col5"] = "bad"
+
+        frames = await process_chunk_to_frames(df)
+
+        assert [f["depth"] for f in frames] == [100.0, 300.0]
+
     @pytest.mark.asyncio
     async def test_process_chunk_empty(self):
         """Test processing empty chunk."""
@@ -232,17 +232,54 @@ class TestLegacyWrapper:
         assert resized.shape == (150,)
         assert resized.dtype == np.uint8
 
-    def test_matches_new_function(self):
-        """Legacy wrapper produces same results as resize_gray_width."""
+    def test_matches_linear_interpolation(self):
+        """Legacy wrapper matches a reference pixel-center linear interpolation."""
         row = np.random.randint(0, 256, 200, dtype=np.uint8)
 
-        # Legacy method
-        resized_legacy = resize_grayscale_row(row, target_width=150)
+        resized = resize_grayscale_row(row, target_width=150)
+
+        # Reference: sample source at pixel centers, clamp at the borders
+        x = (np.arange(150) + 0.5) * (200 / 150) - 0.5
+        expected = np.interp(x, np.arange(200), row.astype(np.float64))
+        expected = np.floor(expected + 0.5).astype(np.uint8)
+
+        assert np.all(np.abs(resized.astype(int) - expected.astype(int)) <= 1)
+
+    def test_weight_tables_cached(self):
+        """Index/weight tables are computed once per (source, target) pair."""
+        from app.processing.image import _get_weights
+
+        assert _get_weights(200, 150) is _get_weights(200, 150)
+
+    def test_default_weight_tables_precomputed(self):
+        """The 200 → 150 ingestion tables are built at import time."""
+        from app.processing.image import _WEIGHT_CACHE
+
+        assert _WEIGHT_CACHE.get((200, 150)) is not None
 
-        # New method
-        resized_new = resize_gray_width(row.reshape(1, -1), new_width=150).flatten()
+    def test_weight_cache_bounded(self):
+        """Arbitrary requested widths cannot grow the table cache without limit."""
+        from app.processing.image import _WEIGHT_CACHE, WIDTH_CACHE_SIZE, _get_weights
+
+        for width in range(1, 3 * WIDTH_CACHE_SIZE):
+            _get_weights(200, width)
+
+        assert _WEIGHT_CACHE.stats()["size"] <= WIDTH_CACHE_SIZE
+
+    def test_single_pixel_source(self):
+        """A 1-pixel row is replicated to the target width."""
+        row = np.array([42], dtype=np.uint8)
+        resized = resize_grayscale_row(row, target_width=5)
+
+        np.testing.assert_array_equal(resized, np.full(5, 42, dtype=np.uint8))
+
+    def test_same_width_is_identity(self):
+        """Equal source and target widths return an unchanged copy."""
+        row = np.random.randint(0, 256, 200, dtype=np.uint8)
+        resized = resize_grayscale_row(row, target_width=200)
 
-        np.testing.assert_array_equal(resized_legacy, resized_new)
+        np.testing.assert_array_equal(resized, row)
+        assert resized is not row
 
 
 class TestIntegration: